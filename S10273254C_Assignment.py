@@ -1,12 +1,27 @@
 import os
+import sys
+import socket
 import json
+import math
 import random
-from random import randint
+import hashlib
+import time
 
 # ---------- Configuration ----------
 MAP_FILES = {1: "level1.txt", 2: "level2.txt"}
-SAVE_FILE = "savegame.json"
+SAVE_FILE = "savegame.json"  # old single-save format, imported into a slot once
+SAVE_DIR = "saves"
+SLOT_DIR = os.path.join(SAVE_DIR, "slots")  # one small JSON manifest per save slot
+CHUNK_DIR = os.path.join(SAVE_DIR, "chunks")  # shared map/fog chunks, named by content hash
+CHUNK_ROWS = 32  # chunks cover bands of this many full map rows
+CHUNK_GRACE_SECONDS = 3600  # unreferenced chunks younger than this may belong to a save in progress
+LOCK_FILE = os.path.join(SAVE_DIR, "store.lock")  # held while writing slots or sweeping chunks
+LOCK_STALE_SECONDS = 60  # a lock this old was left behind by a crashed process
+SWEEP_EVERY = 50  # sweep unused chunks after this many slot overwrites
+SWEEP_COUNTER_FILE = os.path.join(SAVE_DIR, "overwrites")  # overwrites since the last sweep
+DAMAGED_DIR = os.path.join(SAVE_DIR, "damaged")  # unreadable slot manifests are moved here
 SCORES_FILE = "scores.json"
+STATS_DIR = "stats"  # one statistics file per game process, merged when shown
 
 TURNS_PER_DAY = 20
 WIN_GP = 800  # increased because of second level
@@ -19,12 +34,69 @@ mineral_price_ranges = {"copper": (1, 3), "silver": (5, 8), "gold": (10, 18)}
 PICKAXE_UPGRADE_PRICES = {2: 50, 3: 150}
 TORCH_PRICE = 50  # magic torch price
 
+MAP_VIEW_WIDTH = 40  # largest part of a level the (M)ap view prints at once
+MAP_VIEW_HEIGHT = 12
+MINIMAP_WIDTH = 20  # minimap size in cells; each cell summarises a block of tiles
+MINIMAP_HEIGHT = 8
+ROW_TEXT_CHUNK = 32  # map row text is cached in pieces of this many columns
+
+SKETCH_GAMMA = 1.02  # bucket growth factor for quantile sketches (~1% relative error)
+
 
 # ---------- Utilities ----------
 def in_bounds(x, y, grid):
     return 0 <= y < len(grid) and 0 <= x < len(grid[0])
 
 
+# ---------- Random streams ----------
+MASK64 = (1 << 64) - 1
+GOLDEN64 = 0x9E3779B97F4A7C15
+
+stream_ids = {}
+
+
+def mix64(z):
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+    return z ^ (z >> 31)
+# splitmix64 finaliser: spreads every input bit over the whole 64-bit result.
+
+
+def key_id(key):
+    if isinstance(key, int):
+        return key & MASK64
+    if key not in stream_ids:
+        text = str(key).encode("utf-8")
+        stream_ids[key] = int.from_bytes(hashlib.blake2b(text, digest_size=8).digest(), "big")
+    return stream_ids[key]
+# Ints are used as they are; names like "regrow" or "gold" are hashed once and cached.
+
+
+def tile_key(lvl, x, y):
+    return lvl << 48 | y << 24 | x
+
+
+def rng_state(seed, stream, day):
+    return mix64((mix64((mix64(key_id(seed) + GOLDEN64) ^ key_id(stream)) + GOLDEN64) ^ day) + GOLDEN64 & MASK64)
+# Starting point shared by every draw of one stream on one day.
+
+
+def rng_u64(seed, stream, day, key, n=0):
+    return mix64((rng_state(seed, stream, day) ^ key_id(key)) + (n + 1) * GOLDEN64 & MASK64)
+# Counter-based generator: the n-th draw for (seed, stream, day, key) is computed
+# directly (splitmix64 in counter mode), so no draw depends on how many others
+# came before it. Each subsystem ("mine", "price", "regrow") uses its own stream.
+
+
+def rng_random(seed, stream, day, key, n=0):
+    return rng_u64(seed, stream, day, key, n) / 2**64
+
+
+def rng_randint(seed, stream, day, key, a, b, n=0):
+    return a + rng_u64(seed, stream, day, key, n) % (b - a + 1)
+# Same range as random.randint(a, b), but for one fixed point of a stream.
+
+
 # ---------- Map loading ----------
 def load_map_file(filename):
     if not os.path.exists(filename):
@@ -37,39 +109,206 @@ def load_map_file(filename):
 
 
 def create_fog(map_grid):
-    return [["?" for _ in row] for row in map_grid]
-# Creates a “fog-of-war” layer with ? covering all squares.
+    return {
+        "width": len(map_grid[0]),
+        "rows": [0] * len(map_grid),  # bit x of rows[y] is set once tile (x, y) is revealed
+        "explored": 0,  # number of revealed tiles
+        "dirty": set(),  # rows whose text changed since the renderer last built them
+        "row_text": [{} for _ in map_grid],  # renderer's cached row text, per ROW_TEXT_CHUNK columns
+    }
+# Creates a “fog-of-war” layer with ? covering all squares, one bitset per map row.
 
 
-def clear_fog_around(fog, map_grid, px, py, radius=1):
-    for dy in range(-radius, radius + 1):
-        for dx in range(-radius, radius + 1):
-            nx, ny = px + dx, py + dy
-            if in_bounds(nx, ny, map_grid):
-                fog[ny][nx] = map_grid[ny][nx]
+def fog_revealed(fog, x, y):
+    return fog["rows"][y] >> x & 1 == 1
+
+
+def fog_char(fog, map_grid, x, y):
+    return map_grid[y][x] if fog_revealed(fog, x, y) else "?"
+# What the player sees at (x, y): the map tile once revealed, else ?.
+
+
+def fog_row_text(fog, map_grid, y, left=0, width=None):
+    width = fog["width"] - left if width is None else width
+    if y in fog["dirty"]:
+        fog["row_text"][y] = {}
+        fog["dirty"].discard(y)
+    pieces = fog["row_text"][y]
+    first, last = left // ROW_TEXT_CHUNK, (left + width - 1) // ROW_TEXT_CHUNK
+    text = ""
+    for c in range(first, last + 1):
+        if c not in pieces:
+            x0 = c * ROW_TEXT_CHUNK
+            pieces[c] = "".join(fog_char(fog, map_grid, x, y) for x in range(x0, min(x0 + ROW_TEXT_CHUNK, fog["width"])))
+        text += pieces[c]
+    start = left - first * ROW_TEXT_CHUNK
+    return text[start:start + width]
+# Text of columns left..left+width-1 of a row. Only the pieces in that window
+# are rebuilt after the row changes, so the cost does not grow with level width.
+
+
+reveal_masks = {}
+
+
+def reveal_mask(radius):
+    if radius not in reveal_masks:
+        row_bits = (1 << (2 * radius + 1)) - 1
+        reveal_masks[radius] = [(dy, row_bits) for dy in range(-radius, radius + 1)]
+    return reveal_masks[radius]
+# (dy, bits) pairs for a (2r+1)x(2r+1) square; bit `radius` is the player's column.
+# Built once per torch radius and reused for every step.
+
+
+def clear_fog_along(fog, map_grid, path, radius=1, minimap=None):
+    full = (1 << fog["width"]) - 1
+    new_bits = {}
+    for px, py in path:
+        for dy, bits in reveal_mask(radius):
+            y = py + dy
+            if 0 <= y < len(fog["rows"]):
+                shift = px - radius
+                bits = bits << shift if shift >= 0 else bits >> -shift
+                new_bits[y] = new_bits.get(y, 0) | bits
+    for y, bits in new_bits.items():
+        bits &= full & ~fog["rows"][y]
+        if not bits:
+            continue
+        fog["rows"][y] |= bits
+        fog["explored"] += bits.bit_count()
+        fog["dirty"].add(y)
+        if minimap:
+            while bits:
+                x = (bits & -bits).bit_length() - 1
+                minimap_update(minimap, x, y, "?", map_grid[y][x])
+                bits &= bits - 1
+# Reveals tiles within radius of every position on path in one pass per row.
+# Only tiles that were still hidden are touched; the minimap is kept in step if given.
+
+
+def clear_fog_around(fog, map_grid, px, py, radius=1, minimap=None):
+    clear_fog_along(fog, map_grid, [(px, py)], radius, minimap)
 # Reveals tiles around the player’s position within radius.
 
 
-# ---------- Drawing ----------
-def draw_map(map_grid, fog, show_portal=None, show_miner=None):
-    width = len(map_grid[0])
-    print("+" + "-" * width + "+")
-    for y in range(len(map_grid)):
-        row = "|"
+# ---------- Minimap ----------
+def build_minimap(fog, map_grid):
+    height, width = len(map_grid), len(map_grid[0])
+    bw = -(-width // MINIMAP_WIDTH)  # ceiling division
+    bh = -(-height // MINIMAP_HEIGHT)
+    cols, rows = -(-width // bw), -(-height // bh)
+    minimap = {
+        "bw": bw,
+        "bh": bh,
+        "width": width,
+        "height": height,
+        "seen": [[0] * cols for _ in range(rows)],
+    }
+    for sym in mineral_names:
+        minimap[sym] = [[0] * cols for _ in range(rows)]
+    for y in range(height):
         for x in range(width):
-            if show_miner and (x, y) == show_miner:
+            if fog_revealed(fog, x, y):
+                minimap_update(minimap, x, y, "?", map_grid[y][x])
+    return minimap
+# Per-block counts of revealed tiles and revealed ore, built once per level.
+# Afterwards they are updated tile by tile, so drawing never rescans the fog.
+
+
+def minimap_update(minimap, x, y, old, new):
+    bx, by = x // minimap["bw"], y // minimap["bh"]
+    if old == "?" and new != "?":
+        minimap["seen"][by][bx] += 1
+    if old in mineral_names:
+        minimap[old][by][bx] -= 1
+    if new in mineral_names:
+        minimap[new][by][bx] += 1
+# Call whenever what the player sees at a tile changes from old to new.
+
+
+def draw_minimap(minimap, show_portal=None, show_miner=None):
+    bw, bh = minimap["bw"], minimap["bh"]
+    cols = len(minimap["seen"][0])
+    print(f"Minimap (1 cell = {bw}x{bh} tiles)")
+    print("+" + "-" * cols + "+")
+    for by in range(len(minimap["seen"])):
+        row = "|"
+        for bx in range(cols):
+            tiles = (min(bw, minimap["width"] - bx * bw)) * (min(bh, minimap["height"] - by * bh))
+            seen = minimap["seen"][by][bx]
+            best = max(mineral_names, key=lambda sym: minimap[sym][by][bx])
+            if show_miner and (show_miner[0] // bw, show_miner[1] // bh) == (bx, by):
                 row += "M"
-            elif show_portal and (x, y) == show_portal:
+            elif show_portal and (show_portal[0] // bw, show_portal[1] // bh) == (bx, by):
                 row += "P"
+            elif seen == 0:
+                row += "?"
+            elif minimap[best][by][bx] > 0:
+                row += best
             else:
-                row += fog[y][x]
+                row += " " if seen == tiles else "."
         row += "|"
         print(row)
+    print("+" + "-" * cols + "+")
+# Each cell shows the most common revealed ore in its block,
+# otherwise ' ' if fully explored, '.' if partly explored, '?' if unexplored.
+
+
+# ---------- Drawing ----------
+def draw_map(map_grid, fog, show_portal=None, show_miner=None, left=0, top=0, width=None, height=None):
+    width = width or len(map_grid[0])
+    height = height or len(map_grid)
+    print("+" + "-" * width + "+")
+    for y in range(top, top + height):
+        row = list(fog_row_text(fog, map_grid, y, left, width))
+        if show_portal and show_portal[1] == y and left <= show_portal[0] < left + width:
+            row[show_portal[0] - left] = "P"
+        if show_miner and show_miner[1] == y and left <= show_miner[0] < left + width:
+            row[show_miner[0] - left] = "M"
+        row = "|" + "".join(row) + "|"
+        print(row)
     print("+" + "-" * width + "+")
-# Draws the full map with borders.
+# Draws the map with borders, or only the window starting at (left, top) if a size is given.
 # Uses fog layer so unrevealed tiles show ?.
 # Can highlight the portal (P) and player (M).
 
+
+def map_viewer(map_grid, fog, minimap, show_portal=None, show_miner=None):
+    map_w, map_h = len(map_grid[0]), len(map_grid)
+    if map_w <= MAP_VIEW_WIDTH and map_h <= MAP_VIEW_HEIGHT:
+        draw_map(map_grid, fog, show_portal=show_portal, show_miner=show_miner)
+        return
+    width, height = min(map_w, MAP_VIEW_WIDTH), min(map_h, MAP_VIEW_HEIGHT)
+    cx, cy = show_miner or show_portal or (0, 0)
+    while True:
+        # keep the window inside the map
+        cx = max(width // 2, min(cx, map_w - width + width // 2))
+        cy = max(height // 2, min(cy, map_h - height + height // 2))
+        left, top = cx - width // 2, cy - height // 2
+        print(f"\nShowing columns {left}-{left + width - 1}, rows {top}-{top + height - 1} of {map_w}x{map_h}")
+        print(f"Explored: {fog['explored']} / {map_w * map_h} tiles")
+        draw_map(map_grid, fog, show_portal, show_miner, left, top, width, height)
+        draw_minimap(minimap, show_portal, show_miner)
+        print("(WASD) to scroll, centre on (M)iner or (P)ortal, (L)eave map")
+        c = input("Your choice? ").strip().lower()
+        if c == "w":
+            cy -= height // 2
+        elif c == "s":
+            cy += height // 2
+        elif c == "a":
+            cx -= width // 2
+        elif c == "d":
+            cx += width // 2
+        elif c == "m" and show_miner:
+            cx, cy = show_miner
+        elif c == "p" and show_portal:
+            cx, cy = show_portal
+        elif c == "l":
+            return
+        else:
+            print("Invalid choice.")
+# Map screen for big levels: a scrollable window plus the minimap.
+# Printing cost depends on the window and minimap sizes, not on the level size.
+
 def draw_view(map_grid, fog, px, py, torch=False):
     # torch True -> 5x5 (radius 2), else 3x3 (radius 1)
     radius = 2 if torch else 1
@@ -85,10 +324,9 @@ def draw_view(map_grid, fog, px, py, torch=False):
             elif dx == 0 and dy == 0:
                 row += "M"
             else:
-                ch = fog[ny][nx]
                 # When revealed show the underlying map character (minerals as letters),
                 # when not revealed show space in small view (matching PDF style)
-                row += " " if ch == "?" else ch
+                row += map_grid[ny][nx] if fog_revealed(fog, nx, ny) else " "
         row += "|"
         print(row)
     print(border)
@@ -96,7 +334,7 @@ def draw_view(map_grid, fog, px, py, torch=False):
 # Shows M in the middle, unrevealed tiles as blank spaces, out-of-bounds as #.
 
 # ---------- Player / State ----------
-def initialize_player():
+def initialize_player(seed=None):
     return {
         "name": "",
         "level": 1,  # current mine level (1 or 2)
@@ -115,35 +353,338 @@ def initialize_player():
         "turns": TURNS_PER_DAY,
         "pickaxe": 1,
         "torch": False,
+        "upgrades": [],  # shop purchases in the order they were made
+        # seeds all random streams for this game; pick one for repeatable games
+        "seed": random.getrandbits(32) if seed is None else seed,
+        "game_id": os.urandom(8).hex(),  # tells apart saves of players with the same name
     }
 # Creates a dictionary with all player stats.
 
 
 # ---------- Save / Load ----------
-def save_game(map_grids, fogs, player):
+def store_chunk(text):
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    path = os.path.join(CHUNK_DIR, digest[:2], digest)
+    try:
+        os.utime(path)  # mark as recently used so a sweep keeps it
+        return digest
+    except FileNotFoundError:
+        pass  # new chunk, or swept since another save wrote it: write it (again)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)  # other saves never see a half-written chunk
+    return digest
+# Stores a chunk once under its hash; identical chunks from any save are shared.
+
+
+def lock_store(timeout=10):
+    os.makedirs(SAVE_DIR, exist_ok=True)
+    deadline = time.time() + timeout
+    while True:
+        try:
+            os.close(os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            pass
+        try:
+            if time.time() - os.path.getmtime(LOCK_FILE) > LOCK_STALE_SECONDS:
+                os.remove(LOCK_FILE)
+                continue
+        except OSError:
+            continue  # released (or broken) by someone else meanwhile
+        if time.time() > deadline:
+            return False
+        time.sleep(0.05)
+
+
+def unlock_store():
+    try:
+        os.remove(LOCK_FILE)
+    except OSError:
+        pass
+# Lock file shared by every game process on the host, so a sweep never runs
+# between a save writing its chunks and writing the manifest that uses them.
+
+
+def read_chunk(digest, cache):
+    if digest not in cache:
+        with open(os.path.join(CHUNK_DIR, digest[:2], digest), "r", encoding="utf-8") as f:
+            cache[digest] = f.read().split("\n")
+    return cache[digest]
+
+
+def base_level(lvl, map_grid):
+    filename = MAP_FILES.get(lvl, "")
+    if os.path.exists(filename):
+        base = load_map_file(filename)
+        if len(base) == len(map_grid) and len(base[0]) == len(map_grid[0]):
+            return base
+    return [list(row) for row in map_grid]
+# The grid a save is stored relative to: the level file as it was on day 1,
+# or the current map itself if the level file is missing or has changed size.
+
+
+def row_changes(y, row, base_row):
+    changed = [x for x in range(len(row)) if row[x] != base_row[x]]
+    if not changed:
+        return []
+    if len(changed) * 6 > len(row):
+        return [f"R{y}:{''.join(row)}"]  # most of the row changed: store it whole
+    return [f"{x},{y},{row[x]}" for x in changed]
+
+
+def save_level(lvl, map_grid, fog):
+    height = len(map_grid)
+    base = base_level(lvl, map_grid)
+    level = {"width": len(map_grid[0]), "height": height, "base": [], "changes": [], "fog": []}
+    for y0 in range(0, height, CHUNK_ROWS):
+        ys = range(y0, min(y0 + CHUNK_ROWS, height))
+        level["base"].append(store_chunk("\n".join("".join(base[y]) for y in ys)))
+        # mined and regrown tiles, i.e. everything that differs from the level file
+        changes = [line for y in ys for line in row_changes(y, map_grid[y], base[y])]
+        level["changes"].append(store_chunk("\n".join(changes)) if changes else None)
+        level["fog"].append(store_chunk("\n".join(format(fog["rows"][y], "x") for y in ys)))
+    return level
+# Splits one level into bands of rows. The base bands are shared by every save
+# of that level; only the change and fog bands depend on the player.
+
+
+def load_level(level, cache):
+    map_grid = []
+    for digest in level["base"]:
+        map_grid.extend(list(line) for line in read_chunk(digest, cache))
+    for digest in level["changes"]:
+        if digest:
+            for line in read_chunk(digest, cache):
+                if line.startswith("R"):
+                    y, row = line[1:].split(":", 1)
+                    map_grid[int(y)] = list(row)
+                else:
+                    x, y, ch = line.split(",", 2)
+                    map_grid[int(y)][int(x)] = ch
+    fog = create_fog(map_grid)
+    fog["rows"] = [int(line, 16) for digest in level["fog"] for line in read_chunk(digest, cache)]
+    fog["explored"] = sum(bits.bit_count() for bits in fog["rows"])
+    return map_grid, fog
+# Rebuilds a level: the base bands with the player's changes applied.
+
+
+def slot_path(slot):
+    return os.path.join(SLOT_DIR, f"{slot}.json")
+
+
+def valid_slot_name(slot):
+    return slot != "" and all(ch.isalnum() or ch in "-_" for ch in slot)
+
+
+def default_slot_name(name):
+    return "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name) or "save"
+# Player name turned into a valid slot name, e.g. "John Doe" -> "John_Doe".
+
+
+def read_slot_summary(slot):
+    with open(slot_path(slot), "r", encoding="utf-8") as f:
+        summary = json.load(f)["summary"]
+    return {"name": summary["name"], "day": summary["day"], "GP": summary["GP"], "game_id": summary.get("game_id")}
+
+
+def slot_taken(slot, player):
+    if not os.path.exists(slot_path(slot)):
+        return None
+    try:
+        summary = read_slot_summary(slot)
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"name": "an unreadable save", "day": "?", "GP": "?", "game_id": None}
+    return None if summary["game_id"] == player.get("game_id") else summary
+# Summary of the game in slot if it belongs to a different game than player's, else None.
+
+
+def free_slot_name(slot, player):
+    name, n = slot, 1
+    while slot_taken(name, player):
+        n += 1
+        name = f"{slot}-{n}"
+    return name
+# slot, or slot-2, slot-3, ... if another game already uses it.
+
+
+def save_game(map_grids, fogs, player, slot):
     # map_grids: dict level->map_grid ; fogs: dict level->fog
+    if not valid_slot_name(slot):
+        print("Slot names may only use letters, digits, - and _.")
+        return
+    if not lock_store():
+        print("\nThe save store is busy. Please try saving again.")
+        return
+    try:
+        if write_slot(map_grids, fogs, player, slot) and count_overwrite():
+            sweep_unlocked()
+    finally:
+        unlock_store()
+    print(f"\nGame saved to slot '{slot}'.")
+# Saves maps, fog states, and player dictionary to a named slot.
+# Only chunks not already in the store are written, so a save costs
+# roughly what the player changed, not the size of the maps.
+
+
+def write_slot(map_grids, fogs, player, slot):
     data = {
-        "maps": {lvl: ["".join(row) for row in map_grids[lvl]] for lvl in map_grids},
-        "fogs": {lvl: ["".join(row) for row in fogs[lvl]] for lvl in fogs},
+        "summary": {"name": player["name"], "day": player["day"], "GP": player["GP"], "game_id": player.get("game_id")},
+        "levels": {lvl: save_level(lvl, map_grids[lvl], fogs[lvl]) for lvl in map_grids},
         "player": player,
     }
-    with open(SAVE_FILE, "w", encoding="utf-8") as f:
+    os.makedirs(SLOT_DIR, exist_ok=True)
+    overwritten = os.path.exists(slot_path(slot))
+    tmp = f"{slot_path(slot)}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(data, f)
-    print("\nGame saved.")
-# Saves maps, fog states, and player dictionary to JSON.
+    os.replace(tmp, slot_path(slot))
+    return overwritten
+# Writes the slot's chunks and manifest (call with the store locked);
+# returns True if it replaced an existing slot.
 
 
-def load_game():
+def count_overwrite():
+    try:
+        with open(SWEEP_COUNTER_FILE, "r", encoding="utf-8") as f:
+            count = int(f.read()) + 1
+    except (OSError, ValueError):
+        count = 1
+    due = count >= SWEEP_EVERY
+    with open(SWEEP_COUNTER_FILE, "w", encoding="utf-8") as f:
+        f.write("0" if due else str(count))
+    return due
+# Counts slot overwrites (with the store locked); True once a sweep is due.
+
+
+def sweep_chunks():
+    if not lock_store():
+        return 0
+    try:
+        return sweep_unlocked()
+    finally:
+        unlock_store()
+
+
+def sweep_unlocked():
+    referenced = set()
+    for filename in os.listdir(SLOT_DIR) if os.path.isdir(SLOT_DIR) else []:
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(SLOT_DIR, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                levels = json.load(f)["levels"].values()
+            for level in levels:
+                referenced.update(level["base"], level["fog"], (d for d in level["changes"] if d))
+        except OSError:
+            print(f"Could not read save slot '{filename[:-5]}'; chunk sweep skipped.")
+            return 0  # it may be fine, so keep everything it might use
+        except (ValueError, KeyError, TypeError, AttributeError):
+            os.makedirs(DAMAGED_DIR, exist_ok=True)
+            os.replace(path, os.path.join(DAMAGED_DIR, filename))
+            print(f"Save slot '{filename[:-5]}' is damaged; moved it to {DAMAGED_DIR}.")
+    cutoff = time.time() - CHUNK_GRACE_SECONDS
+    removed = 0
+    for folder, _, filenames in os.walk(CHUNK_DIR):
+        for filename in filenames:
+            path = os.path.join(folder, filename)
+            try:
+                if filename not in referenced and os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass  # already removed by another sweep
+    return removed
+# Mark and sweep: deletes chunks no slot manifest refers to any more, so the
+# store only holds what existing saves need. Runs every SWEEP_EVERY overwrites
+# or from the command line (--sweep), since it reads every slot and chunk.
+# Recently used chunks are kept in case a crashed process broke the lock.
+
+
+def list_save_slots():
+    if not os.path.isdir(SLOT_DIR):
+        return []
+    slots = []
+    for filename in sorted(os.listdir(SLOT_DIR)):
+        if filename.endswith(".json"):
+            try:
+                summary = read_slot_summary(filename[:-5])
+            except (OSError, ValueError, KeyError, TypeError):
+                print(f"Skipping unreadable save slot '{filename[:-5]}'.")
+                continue
+            slots.append((filename[:-5], summary))
+    return slots
+# (slot, summary) pairs; reads manifests only, never chunks.
+
+
+def import_old_save():
     if not os.path.exists(SAVE_FILE):
+        return
+    try:
+        with open(SAVE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        maps = {int(k): [list(row) for row in data["maps"][k]] for k in data["maps"]}
+        fogs = {}
+        for k in data["fogs"]:
+            # any tile that is not ? in the old fog has been revealed
+            fog = create_fog(maps[int(k)])
+            fog["rows"] = [sum(1 << x for x, ch in enumerate(row) if ch != "?") for row in data["fogs"][k]]
+            fog["explored"] = sum(bits.bit_count() for bits in fog["rows"])
+            fogs[int(k)] = fog
+        player = data["player"]
+        player.setdefault("seed", 0)
+        player.setdefault("game_id", os.urandom(8).hex())
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        print(f"Could not import the old save file {SAVE_FILE}.")
+        return
+    slot, n = "savegame", 1
+    while os.path.exists(slot_path(slot)):
+        n += 1
+        slot = f"savegame-{n}"
+    if not lock_store():
+        return  # try again next time
+    try:
+        write_slot(maps, fogs, player, slot)
+    finally:
+        unlock_store()
+    os.replace(SAVE_FILE, SAVE_FILE + ".imported")  # so it is only imported once
+    print(f"Imported old save file {SAVE_FILE} as slot '{slot}'.")
+# Moves a game saved by earlier versions into the slot store.
+
+
+def load_game():
+    import_old_save()
+    slots = list_save_slots()
+    if not slots:
+        print("No saved game found.")
+        return None
+    print("\n--- Saved Games ---")
+    for slot, summary in slots:
+        print(f"{slot} - {summary['name']}, Day {summary['day']}, GP: {summary['GP']}")
+    print("-------------------")
+    slot = input("Slot to load? ").strip()
+    if not valid_slot_name(slot) or not os.path.exists(slot_path(slot)):
         print("No saved game found.")
         return None
-    with open(SAVE_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    maps = {int(k): [list(row) for row in data["maps"][k]] for k in data["maps"]}
-    fogs = {int(k): [list(row) for row in data["fogs"][k]] for k in data["fogs"]}
-    player = data["player"]
+    try:
+        with open(slot_path(slot), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cache = {}  # chunks shared between levels are only read once
+        maps, fogs = {}, {}
+        player = data["player"]
+        for k, level in data["levels"].items():
+            maps[int(k)], fogs[int(k)] = load_level(level, cache)
+        # JSON turns the int keys and (x, y) tuples into strings and lists
+        player["portal_positions"] = {int(k): tuple(v) for k, v in player["portal_positions"].items()}
+        player.setdefault("game_id", os.urandom(8).hex())
+    except (OSError, ValueError, KeyError, IndexError, TypeError, AttributeError):
+        print(f"Save slot '{slot}' is damaged and could not be loaded.")
+        return None
     return maps, fogs, player
-# Loads saved data back into game variables.
+# Lists the save slots and loads the chosen one back into game variables.
 
 
 # ---------- Scores ----------
@@ -175,6 +716,200 @@ def update_top_scores(player):
 # 3 of these Reads/writes from scores.json, Stores top 5 scores, sorted by days → steps → GP.
 
 
+# ---------- Simulation statistics ----------
+def game_result(player):
+    return {
+        "days": player["day"] - 1,
+        "steps": player["steps"],
+        "GP": player["GP"],
+        "upgrades": list(player.get("upgrades", [])),
+    }
+# Outcome of one finished game, in the same units as the high score table.
+
+
+def new_accumulator():
+    return {"n": 0, "mean": 0.0, "m2": 0.0, "min": None, "max": None, "zeros": 0, "buckets": {}}
+# Running count, mean and variance (Welford) plus a log-bucket quantile sketch.
+# Memory depends only on the range of values seen, not on how many were added.
+# Values are expected to be non-negative; anything <= 0 is counted in "zeros".
+
+
+def sketch_key(value):
+    return math.ceil(math.log(value) / math.log(SKETCH_GAMMA))
+
+
+def sketch_value(key):
+    return 2 * SKETCH_GAMMA ** key / (1 + SKETCH_GAMMA)
+# Bucket k holds values in (gamma^(k-1), gamma^k] for any value > 0, including
+# fractions (k < 0), so every bucket has the same relative width.
+
+
+def accumulator_add(acc, value):
+    acc["n"] += 1
+    delta = value - acc["mean"]
+    acc["mean"] += delta / acc["n"]
+    acc["m2"] += delta * (value - acc["mean"])
+    acc["min"] = value if acc["min"] is None else min(acc["min"], value)
+    acc["max"] = value if acc["max"] is None else max(acc["max"], value)
+    if value <= 0:
+        acc["zeros"] += 1
+        return
+    key = sketch_key(value)
+    acc["buckets"][key] = acc["buckets"].get(key, 0) + 1
+
+
+def accumulator_merge(a, b):
+    if b["n"] == 0:
+        return
+    if a["n"] == 0:
+        a.update(b, buckets=dict(b["buckets"]))
+        return
+    n = a["n"] + b["n"]
+    delta = b["mean"] - a["mean"]
+    a["mean"] += delta * b["n"] / n
+    a["m2"] += b["m2"] + delta * delta * a["n"] * b["n"] / n
+    a["n"] = n
+    a["min"] = min(a["min"], b["min"])
+    a["max"] = max(a["max"], b["max"])
+    a["zeros"] += b["zeros"]
+    for key, count in b["buckets"].items():
+        a["buckets"][key] = a["buckets"].get(key, 0) + count
+# Merges b into a (Chan et al. pairwise update), e.g. results from another worker.
+
+
+def accumulator_variance(acc):
+    if acc["n"] < 2:
+        return 0.0
+    return acc["m2"] / (acc["n"] - 1)
+
+
+def accumulator_quantile(acc, q):
+    if acc["n"] == 0:
+        return None
+    if q <= 0:
+        return acc["min"]
+    if q >= 1:
+        return acc["max"]
+    rank = q * (acc["n"] - 1)
+    seen = acc["zeros"]
+    if seen > rank:
+        return min(max(0, acc["min"]), acc["max"])
+    for key in sorted(acc["buckets"]):
+        seen += acc["buckets"][key]
+        if seen > rank:
+            return min(max(sketch_value(key), acc["min"]), acc["max"])
+    return acc["max"]
+# Approximate q-quantile (0 <= q <= 1), within about 1% of the true value
+# (exact for q = 0 and q = 1, which return the min and max).
+
+
+def new_sim_stats():
+    return {
+        "games": 0,
+        "days": new_accumulator(),
+        "steps": new_accumulator(),
+        "GP": new_accumulator(),
+        "days_hist": {},  # days-to-win -> number of games
+        "upgrade_orders": {},  # order of first purchase of each upgrade -> number of games
+    }
+# Streaming summary of many simulated games; never stores individual results.
+
+
+def sim_stats_add(stats, result):
+    stats["games"] += 1
+    for field in ("days", "steps", "GP"):
+        accumulator_add(stats[field], result[field])
+    days = result["days"]
+    stats["days_hist"][days] = stats["days_hist"].get(days, 0) + 1
+    # only the first purchase of each upgrade counts, so the number of keys stays small
+    order = []
+    for item in result["upgrades"]:
+        if item not in order:
+            order.append(item)
+    order = ">".join(order) or "none"
+    stats["upgrade_orders"][order] = stats["upgrade_orders"].get(order, 0) + 1
+
+
+def sim_stats_merge(stats, other):
+    stats["games"] += other["games"]
+    for field in ("days", "steps", "GP"):
+        accumulator_merge(stats[field], other[field])
+    for key in ("days_hist", "upgrade_orders"):
+        for k, count in other[key].items():
+            stats[key][k] = stats[key].get(k, 0) + count
+# Combines the summary from another worker/process into stats.
+
+
+def show_sim_stats(stats):
+    print(f"\n----- Game Statistics ({stats['games']} games) -----")
+    for field in ("days", "steps", "GP"):
+        acc = stats[field]
+        if acc["n"] == 0:
+            continue
+        print(
+            f"{field}: mean {acc['mean']:.2f}, sd {math.sqrt(accumulator_variance(acc)):.2f}, "
+            f"min {acc['min']}, p50 {accumulator_quantile(acc, 0.5):.1f}, "
+            f"p90 {accumulator_quantile(acc, 0.9):.1f}, max {acc['max']}"
+        )
+    print("Days to win:")
+    for days in sorted(stats["days_hist"]):
+        print(f"  {days:>4}: {stats['days_hist'][days]}")
+    print("Upgrade orders:")
+    for order, count in sorted(stats["upgrade_orders"].items(), key=lambda e: -e[1]):
+        print(f"  {order}: {count}")
+    print("-" * 40)
+
+
+def stats_path():
+    return os.path.join(STATS_DIR, f"{socket.gethostname()}-{os.getpid()}.json")
+# This process's own statistics file, so processes never write the same file.
+
+
+def read_sim_stats(path):
+    with open(path, "r", encoding="utf-8") as f:
+        stats = json.load(f)
+    # JSON turns the int keys into strings
+    for field in ("days", "steps", "GP"):
+        stats[field]["buckets"] = {int(k): v for k, v in stats[field]["buckets"].items()}
+    stats["days_hist"] = {int(k): v for k, v in stats["days_hist"].items()}
+    return stats
+
+
+def load_sim_stats():
+    stats = new_sim_stats()
+    if not os.path.isdir(STATS_DIR):
+        return stats
+    for filename in sorted(os.listdir(STATS_DIR)):
+        if not filename.endswith(".json"):
+            continue
+        try:
+            sim_stats_merge(stats, read_sim_stats(os.path.join(STATS_DIR, filename)))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            print(f"Skipping unreadable statistics file {filename}.")
+    return stats
+# Merges the statistics written by every process.
+
+
+def save_sim_stats(stats):
+    os.makedirs(STATS_DIR, exist_ok=True)
+    tmp = f"{stats_path()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+    os.replace(tmp, stats_path())  # readers never see a half-written file
+
+
+def record_game_stats(player):
+    stats = new_sim_stats()
+    if os.path.exists(stats_path()):
+        try:
+            stats = read_sim_stats(stats_path())
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            print("Statistics file was damaged; starting it again.")
+    sim_stats_add(stats, game_result(player))
+    save_sim_stats(stats)
+# Adds a finished game to this process's statistics file.
+
+
 # ---------- Game mechanics ----------
 def sell_ore(player, source, amounts=None):
     # source: "backpack" or "warehouse"
@@ -198,7 +933,8 @@ def sell_ore(player, source, amounts=None):
     for m, qty in sell_map.items():
         if qty <= 0:
             continue
-        price = randint(*mineral_price_ranges[m])
+        # one price per mineral per day, whatever else has been drawn
+        price = rng_randint(player.get("seed", 0), "price", player["day"], m, *mineral_price_ranges[m])
         value = price * qty
         print(f"You sell {qty} {m} ore for {value} GP.")
         gained += value
@@ -239,12 +975,13 @@ def can_mine(symbol, pickaxe):
 # Checks if player’s pickaxe can mine a mineral type.
 
 
-def mine_tile(map_grid, fog, player):
+def mine_tile(map_grid, fog, player, minimap=None):
     sym = map_grid[player["y"]][player["x"]]
     if sym not in mineral_names:
         return False
     m = mineral_names[sym]
-    pieces = randint(*mineral_piece_ranges[m])
+    tile = tile_key(player["level"], player["x"], player["y"])
+    pieces = rng_randint(player.get("seed", 0), "mine", player["day"], tile, *mineral_piece_ranges[m])
     load = player["copper"] + player["silver"] + player["gold"]
     space = player["capacity"] - load
     if space <= 0:
@@ -255,24 +992,55 @@ def mine_tile(map_grid, fog, player):
     if take < pieces:
         print(f"...but you can only carry {take} more piece(s)!")
     player[m] += take
+    if minimap:
+        minimap_update(minimap, player["x"], player["y"], fog_char(fog, map_grid, player["x"], player["y"]), " ")
     map_grid[player["y"]][player["x"]] = " "
-    fog[player["y"]][player["x"]] = " "
+    fog["dirty"].add(player["y"])
     return True
 # Mines ore at player’s position.
 # Random pieces taken (limited by backpack space).
 # Removes mineral from map and fog.
 
 
-def replenish_day(map_maps):
+REGROW_THRESHOLD = int(0.2 * 2**64)  # 20% of draws regrow a mineral
+
+
+def regrown_ore(seed, day, lvl, x, y):
+    if rng_u64(seed, "regrow", day, tile_key(lvl, x, y)) >= REGROW_THRESHOLD:
+        return None
+    return regrow_mineral(rng_random(seed, "regrow", day, tile_key(lvl, x, y), n=1))
+# The ore an empty tile regrows on a given day, or None; one tile, any order.
+
+
+def regrow_mineral(r):
+    return "C" if r < 0.7 else ("S" if r < 0.95 else "G")
+
+
+def replenish_day(map_maps, seed, day, fogs=None, minimaps=None):
     # map_maps: dict level->map_grid
+    # fogs/minimaps (optional): kept in step where a regrown tile is already revealed
+    # every tile has its own draws, so levels/rows can be regrown in any order
+    # the first draw (regrow or not) is inlined; it runs for every empty tile
+    state = rng_state(seed, "regrow", day)
     for lvl in map_maps:
         grid = map_maps[lvl]
         for y in range(len(grid)):
-            for x in range(len(grid[0])):
-                if grid[y][x] == " " and random.random() < 0.2:
-                    r = random.random()
-                    grid[y][x] = "C" if r < 0.7 else ("S" if r < 0.95 else "G")
+            for x, ch in enumerate(grid[y]):
+                if ch != " ":
+                    continue
+                keyed = state ^ (lvl << 48 | y << 24 | x)
+                z = keyed + GOLDEN64 & MASK64
+                z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+                z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+                if z ^ (z >> 31) < REGROW_THRESHOLD:
+                    # same draws as regrown_ore(seed, day, lvl, x, y)
+                    grid[y][x] = regrow_mineral(mix64(keyed + 2 * GOLDEN64 & MASK64) / 2**64)
+                    if fogs and fog_revealed(fogs[lvl], x, y):
+                        fogs[lvl]["dirty"].add(y)
+                        if minimaps:
+                            minimap_update(minimaps[lvl], x, y, " ", grid[y][x])
 # Bonus feature: 20% chance that empty tiles regenerate minerals.
+# Regrown tiles that are already revealed show up on the map straight away.
 
 # ---------- Menus & UI ----------
 def intro():
@@ -289,6 +1057,7 @@ def main_menu():
     print("(N)ew game")
     print("(L)oad saved game")
     print("(H)igh scores")
+    print("(S)tatistics")
     print("(Q)uit")
     print("------------------")
 
@@ -333,6 +1102,7 @@ def shop(player):
             if player["GP"] >= cost:
                 player["GP"] -= cost
                 player["pickaxe"] = lvl
+                player.setdefault("upgrades", []).append(f"pickaxe{lvl}")
                 print("Congratulations!")
             else:
                 print("You do not have enough GP for that upgrade.")
@@ -340,6 +1110,7 @@ def shop(player):
             if player["GP"] >= bp_cost:
                 player["GP"] -= bp_cost
                 player["capacity"] += 2
+                player.setdefault("upgrades", []).append("backpack")
                 print("Congratulations!")
             else:
                 print("You do not have enough GP for that upgrade.")
@@ -347,6 +1118,7 @@ def shop(player):
             if player["GP"] >= TORCH_PRICE:
                 player["GP"] -= TORCH_PRICE
                 player["torch"] = True
+                player.setdefault("upgrades", []).append("torch")
                 print("You purchased the Magic Torch! Your viewport is now 5x5.")
             else:
                 print("You do not have enough GP for that upgrade.")
@@ -441,7 +1213,7 @@ def sell_menu(player):
 
 
 # ---------- Mine loop ----------
-def enter_mine(map_maps, fogs, player):
+def enter_mine(map_maps, fogs, minimaps, player):
     lvl = player["level"]
     # when entering from town, if at town coords (0,0) appear at stored portal pos for that level
     if player["x"] == 0 and player["y"] == 0:
@@ -449,9 +1221,10 @@ def enter_mine(map_maps, fogs, player):
         player["x"], player["y"] = px, py
     current_map = map_maps[lvl]
     current_fog = fogs[lvl]
+    current_minimap = minimaps[lvl]
 
     # reveal around player
-    clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1)
+    clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1, minimap=current_minimap)
 
     while True:
         print("\n---------------------------------------------------")
@@ -478,7 +1251,7 @@ def enter_mine(map_maps, fogs, player):
                     player["x"], player["y"] = nx, ny
                     place_portal(player)
                     # replenish all maps
-                    replenish_day(map_maps)
+                    replenish_day(map_maps, player.get("seed", 0), player["day"], fogs, minimaps)
                     return
                 # If door 'D' leads to Level 2 (only if there is a level2 map file loaded)
                 if tile == "D":
@@ -501,27 +1274,28 @@ def enter_mine(map_maps, fogs, player):
                         lvl = player["level"]
                         current_map = map_maps[lvl]
                         current_fog = fogs[lvl]
-                        clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1)
+                        current_minimap = minimaps[lvl]
+                        clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1, minimap=current_minimap)
                 elif tile in mineral_names:
                     if not can_mine(tile, player["pickaxe"]):
                         print("You can't go there — you can't mine that mineral yet.")
                     else:
                         player["x"], player["y"] = nx, ny
-                        if mine_tile(current_map, current_fog, player):
+                        if mine_tile(current_map, current_fog, player, current_minimap):
                             player["steps"] += 1
-                            clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1)
+                            clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1, minimap=current_minimap)
                 else:
                     # empty or other tile: move normally
                     player["x"], player["y"] = nx, ny
                     player["steps"] += 1
-                    clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1)
+                    clear_fog_around(current_fog, current_map, player["x"], player["y"], radius=2 if player["torch"] else 1, minimap=current_minimap)
             if player["turns"] <= 0:
                 print("\nYou are exhausted.")
                 place_portal(player)
-                replenish_day(map_maps)
+                replenish_day(map_maps, player.get("seed", 0), player["day"], fogs, minimaps)
                 return
         elif act == "m":
-            draw_map(current_map, current_fog, show_portal=player["portal_positions"].get(lvl), show_miner=(player["x"], player["y"]))
+            map_viewer(current_map, current_fog, current_minimap, show_portal=player["portal_positions"].get(lvl), show_miner=(player["x"], player["y"]))
         elif act == "i":
             player_info(player)
         elif act == "p":
@@ -529,7 +1303,7 @@ def enter_mine(map_maps, fogs, player):
             # store current pos as portal for this level
             player["portal_positions"][lvl] = (player["x"], player["y"])
             place_portal(player)
-            replenish_day(map_maps)
+            replenish_day(map_maps, player.get("seed", 0), player["day"], fogs, minimaps)
             return
         elif act == "q":
             if input("Quit to main menu? (Y/N) ").strip().lower() == "y":
@@ -545,10 +1319,12 @@ def enter_mine(map_maps, fogs, player):
 
 
 # ---------- Main Flow ----------
-def main():
+def main(seed=None):
+    # seed: optional fixed seed for every new game (e.g. one per worker)
     # load maps for levels available
     maps = {}
     fogs = {}
+    minimaps = {}
     # always try to load level1; level2 optional
     try:
         maps[1] = load_map_file(MAP_FILES[1])
@@ -573,7 +1349,7 @@ def main():
                 name = input("\nGreetings, miner! What is your name? ").strip()
                 if not name:
                     name = "Anonymous"
-                player = initialize_player()
+                player = initialize_player(seed)
                 player["name"] = name
                 # reset maps & fogs
                 maps[1] = load_map_file(MAP_FILES[1])
@@ -583,6 +1359,7 @@ def main():
                     fogs[2] = create_fog(maps[2])
                 # clear fog at town start pos for level 1 only
                 clear_fog_around(fogs[1], maps[1], 0, 0)
+                minimaps = {lvl: build_minimap(fogs[lvl], maps[lvl]) for lvl in fogs}
                 print(f"\nPleased to meet you, {player['name']}. Welcome to Sundrop Town!\n")
                 state = "town"
             elif c == "l":
@@ -592,6 +1369,7 @@ def main():
                     # ensure keys are ints
                     maps = {int(k): maps[k] for k in maps}
                     fogs = {int(k): fogs[k] for k in fogs}
+                    minimaps = {lvl: build_minimap(fogs[lvl], maps[lvl]) for lvl in fogs}
                     print("\nGame loaded. Returning to town.")
                     state = "town"
                 else:
@@ -606,6 +1384,8 @@ def main():
                     print("------------------")
                 else:
                     print("\nNo high scores yet.")
+            elif c == "s":
+                show_sim_stats(load_sim_stats())
             elif c == "q":
                 print("Goodbye!")
                 break
@@ -620,9 +1400,9 @@ def main():
                 player_info(player)
             elif c == "m":
                 # show level1 map with portal for level1; show miner at town (0,0)
-                draw_map(maps[1], fogs[1], show_portal=player["portal_positions"].get(1, (0, 0)), show_miner=(0, 0))
+                map_viewer(maps[1], fogs[1], minimaps[1], show_portal=player["portal_positions"].get(1, (0, 0)), show_miner=(0, 0))
             elif c == "e":
-                enter_mine(maps, fogs, player)
+                enter_mine(maps, fogs, minimaps, player)
                 if player["GP"] >= WIN_GP:
                     print("\n-------------------------------------------------------------")
                     print(f"Woo-hoo! Well done, {player['name']}, you have {player['GP']} GP!")
@@ -630,6 +1410,7 @@ def main():
                     print(f"And it only took you {player['day']} days and {player['steps']} steps! You win!")
                     print("-------------------------------------------------------------\n")
                     update_top_scores(player)
+                    record_game_stats(player)
                     state = "main"
                 else:
                     state = "town"
@@ -638,7 +1419,19 @@ def main():
             elif c == "w":
                 warehouse_menu(player)
             elif c == "v":
-                save_game(maps, fogs, player)
+                default = free_slot_name(default_slot_name(player["name"]), player)
+                while True:
+                    slot = input(f"Save slot name? (Enter for '{default}') ").strip() or default
+                    if not valid_slot_name(slot):
+                        print("Slot names may only use letters, digits, - and _.")
+                        continue
+                    other = slot_taken(slot, player)
+                    if not other:
+                        break
+                    print(f"Slot '{slot}' holds another game ({other['name']}, Day {other['day']}, GP: {other['GP']}).")
+                    if input("Overwrite it? (Y/N) ").strip().lower() == "y":
+                        break
+                save_game(maps, fogs, player, slot)
             elif c == "q":
                 if input("Quit to main menu? (Y/N) ").strip().lower() == "y":
                     state = "main"
@@ -647,4 +1440,14 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = sys.argv[1:]
+    if args == ["--sweep"]:
+        print(f"Removed {sweep_chunks()} unused save chunks.")
+        sys.exit(0)
+    if len(args) > 1 or (args and not args[0].isdigit()):
+        print(f"Usage: python {os.path.basename(sys.argv[0])} [seed]")
+        print(f"       python {os.path.basename(sys.argv[0])} --sweep")
+        print("  seed: optional whole number; games with the same seed play out the same")
+        print("  --sweep: delete save chunks no save slot uses any more")
+        sys.exit(2)
+    main(int(args[0]) if args else None)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import S10273254C_Assignment as game
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_dir(tmp_path, monkeypatch):
+    for filename in game.MAP_FILES.values():
+        shutil.copy(os.path.join(HERE, filename), tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+
+def new_game(seed):
+    maps = {lvl: game.load_map_file(filename) for lvl, filename in game.MAP_FILES.items()}
+    fogs = {lvl: game.create_fog(maps[lvl]) for lvl in maps}
+    player = game.initialize_player(seed)
+    player["name"] = f"player{seed}"
+    return maps, fogs, player
+
+
+def play_days(maps, fogs, player, days):
+    for _ in range(days):
+        for y, row in enumerate(maps[1]):
+            for x, ch in enumerate(row):
+                if ch in game.mineral_names and (x + y + player["day"]) % 4 == 0:
+                    row[x] = " "
+                    game.clear_fog_around(fogs[1], maps[1], x, y, 1)
+        player["day"] += 1
+        game.replenish_day(maps, player["seed"], player["day"], fogs)
+
+
+def load_slot(slot, monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda *args: slot)
+    return game.load_game()
+
+
+def chunk_files():
+    return {name for _, _, names in os.walk(game.CHUNK_DIR) for name in names}
+
+
+def manifest(slot):
+    with open(game.slot_path(slot), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_round_trip_with_mined_and_regrown_tiles(monkeypatch):
+    maps, fogs, player = new_game(1)
+    play_days(maps, fogs, player, 5)
+    player["portal_positions"][1] = (4, 2)
+    assert maps[1] != game.load_map_file(game.MAP_FILES[1])
+    game.save_game(maps, fogs, player, "one")
+
+    loaded_maps, loaded_fogs, loaded_player = load_slot("one", monkeypatch)
+    assert loaded_maps == maps
+    for lvl in fogs:
+        assert loaded_fogs[lvl]["rows"] == fogs[lvl]["rows"]
+        assert loaded_fogs[lvl]["explored"] == fogs[lvl]["explored"]
+    assert loaded_player["portal_positions"][1] == (4, 2)
+    assert loaded_player["day"] == player["day"]
+
+
+def test_slots_share_base_chunks():
+    for seed in (1, 2):
+        maps, fogs, player = new_game(seed)
+        play_days(maps, fogs, player, seed)
+        game.save_game(maps, fogs, player, f"slot{seed}")
+    first, second = manifest("slot1"), manifest("slot2")
+    for lvl in first["levels"]:
+        assert first["levels"][lvl]["base"] == second["levels"][lvl]["base"]
+    # the untouched level-2 fog is shared as well
+    assert first["levels"]["2"]["fog"] == second["levels"]["2"]["fog"]
+
+
+def test_sweep_after_overwrite_keeps_only_referenced_chunks(monkeypatch):
+    monkeypatch.setattr(game, "CHUNK_GRACE_SECONDS", -1)
+    monkeypatch.setattr(game, "SWEEP_EVERY", 1)
+    other_maps, other_fogs, other = new_game(2)
+    game.save_game(other_maps, other_fogs, other, "other")
+
+    maps, fogs, player = new_game(1)
+    play_days(maps, fogs, player, 1)
+    game.save_game(maps, fogs, player, "mine")
+    old_changes = {d for level in manifest("mine")["levels"].values() for d in level["changes"] if d}
+    play_days(maps, fogs, player, 2)
+    game.save_game(maps, fogs, player, "mine")
+
+    referenced = set()
+    for slot in ("mine", "other"):
+        for level in manifest(slot)["levels"].values():
+            referenced.update(level["base"], level["fog"], (d for d in level["changes"] if d))
+    assert old_changes - referenced  # the first save's changes are no longer used
+    assert chunk_files() == referenced
+    assert load_slot("other", monkeypatch)[0] == other_maps
+    assert load_slot("mine", monkeypatch)[0] == maps
+
+
+def test_sweep_quarantines_damaged_slot(monkeypatch):
+    maps, fogs, player = new_game(1)
+    game.save_game(maps, fogs, player, "good")
+    with open(game.slot_path("bad"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+    game.sweep_chunks()
+    assert not os.path.exists(game.slot_path("bad"))
+    assert os.path.exists(os.path.join(game.DAMAGED_DIR, "bad.json"))
+    assert load_slot("good", monkeypatch)[0] == maps
+
+
+def test_old_save_file_is_imported_once(monkeypatch):
+    maps, fogs, player = new_game(1)
+    maps[1][1][3] = " "
+    old_fogs = {lvl: [["?"] * len(row) for row in maps[lvl]] for lvl in maps}
+    old_fogs[1][0][0] = old_fogs[1][0][1] = "T"
+    del player["seed"], player["game_id"]
+    player["portal_positions"] = {"1": [2, 1], "2": [0, 0]}
+    data = {
+        "maps": {str(lvl): ["".join(row) for row in maps[lvl]] for lvl in maps},
+        "fogs": {str(lvl): ["".join(row) for row in old_fogs[lvl]] for lvl in maps},
+        "player": player,
+    }
+    with open(game.SAVE_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    loaded_maps, loaded_fogs, loaded_player = load_slot("savegame", monkeypatch)
+    assert loaded_maps[1] == maps[1]
+    assert loaded_fogs[1]["explored"] == 2
+    assert loaded_player["portal_positions"][1] == (2, 1)
+    assert not os.path.exists(game.SAVE_FILE)
+    assert os.path.exists(game.SAVE_FILE + ".imported")
+    assert [slot for slot, _ in game.list_save_slots()] == ["savegame"]
+
+
+def test_missing_chunk_reports_damaged_slot(monkeypatch, capsys):
+    maps, fogs, player = new_game(1)
+    game.save_game(maps, fogs, player, "one")
+    digest = manifest("one")["levels"]["1"]["fog"][0]
+    os.remove(os.path.join(game.CHUNK_DIR, digest[:2], digest))
+    assert load_slot("one", monkeypatch) is None
+    assert "damaged" in capsys.readouterr().out
+
+
+def test_slot_of_another_game_is_not_offered():
+    maps, fogs, first = new_game(1)
+    first["name"] = "Anonymous"
+    game.save_game(maps, fogs, first, "Anonymous")
+    second = game.initialize_player(2)
+    second["name"] = "Anonymous"
+    assert game.slot_taken("Anonymous", first) is None
+    assert game.slot_taken("Anonymous", second)["name"] == "Anonymous"
+    assert game.free_slot_name("Anonymous", second) == "Anonymous-2"
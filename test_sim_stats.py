@@ -0,0 +1,72 @@
+import json
+import random
+
+import S10273254C_Assignment as game
+
+
+def make_result(rng):
+    upgrades = rng.sample(["pickaxe2", "backpack", "torch", "backpack"], rng.randint(0, 4))
+    return {"days": rng.randint(3, 40), "steps": rng.randint(50, 900), "GP": rng.randint(800, 1200), "upgrades": upgrades}
+
+
+def test_merged_stats_match_single_pass():
+    rng = random.Random(1)
+    results = [make_result(rng) for _ in range(1000)]
+
+    single = game.new_sim_stats()
+    for result in results:
+        game.sim_stats_add(single, result)
+
+    merged = game.new_sim_stats()
+    for start in range(0, len(results), 300):
+        part = game.new_sim_stats()
+        for result in results[start:start + 300]:
+            game.sim_stats_add(part, result)
+        game.sim_stats_merge(merged, part)
+
+    assert merged["games"] == single["games"]
+    assert merged["days_hist"] == single["days_hist"]
+    assert merged["upgrade_orders"] == single["upgrade_orders"]
+    for field in ("days", "steps", "GP"):
+        a, b = merged[field], single[field]
+        assert (a["n"], a["min"], a["max"], a["zeros"], a["buckets"]) == (b["n"], b["min"], b["max"], b["zeros"], b["buckets"])
+        assert abs(a["mean"] - b["mean"]) < 1e-9
+        assert abs(game.accumulator_variance(a) - game.accumulator_variance(b)) < 1e-6
+        for q in (0, 0.5, 0.9, 1):
+            assert game.accumulator_quantile(a, q) == game.accumulator_quantile(b, q)
+
+
+def test_quantile_ends_are_min_and_max():
+    acc = game.new_accumulator()
+    for value in range(501):
+        game.accumulator_add(acc, value)
+    assert game.accumulator_quantile(acc, 0) == 0
+    assert game.accumulator_quantile(acc, 1) == 500
+    assert abs(game.accumulator_quantile(acc, 0.5) - 250) < 250 * 0.02
+
+
+def test_stats_file_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    player = game.initialize_player()
+    player.update(day=6, steps=120, GP=850, upgrades=["pickaxe2", "torch"])
+    game.record_game_stats(player)
+    game.record_game_stats(player)
+    stats = game.load_sim_stats()
+    assert stats["games"] == 2
+    assert stats["days_hist"] == {5: 2}
+    assert stats["upgrade_orders"] == {"pickaxe2>torch": 2}
+    assert game.accumulator_quantile(stats["GP"], 0.5) == 850
+
+
+def test_stats_from_other_processes_are_merged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    player = game.initialize_player()
+    player.update(day=4, steps=90, GP=810)
+    game.record_game_stats(player)
+    other = game.new_sim_stats()
+    game.sim_stats_add(other, game.game_result(player))
+    (tmp_path / "stats" / "otherhost-1.json").write_text(json.dumps(other))
+    (tmp_path / "stats" / "broken.json").write_text("{trunc")
+    stats = game.load_sim_stats()
+    assert stats["games"] == 2
+    assert stats["days_hist"] == {3: 2}